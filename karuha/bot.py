@@ -1315,10 +1315,15 @@ class Bot(object):
         )
 
     async def _recv_loop(self, server: BaseServer) -> None:
+        callbacks = self.server_event_callbacks
         async for message in server:
-            for desc, msg in message.ListFields():
-                for e in self.server_event_callbacks[desc.name]:
-                    e(self, msg)
+            # the payload lives in the "Message" oneof, so skip building the ListFields list
+            field = message.WhichOneof("Message")
+            if field is None:  # pragma: no cover
+                continue
+            msg = getattr(message, field)
+            for e in callbacks.get(field, ()):
+                e(self, msg)
 
     @classmethod
     def __get_pydantic_core_schema__(
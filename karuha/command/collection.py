@@ -38,6 +38,9 @@ class CommandCollection(_ContextHelper):
             self.commands[alias] = command
     
     def get_command(self, name: str, default: Optional[AbstractCommand] = None, /) -> Optional[AbstractCommand]:
+        command = self.commands.get(name)
+        if command is not None:
+            return command
         for c in self._get_commands(name):
             return c
         return default
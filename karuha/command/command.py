@@ -17,6 +17,8 @@ R = TypeVar("R")
 
 
 class AbstractCommand(ABC):
+    __slots__ = ["__name__", "rule", "alias"]
+
     def __init__(self, name: str, /, alias: Optional[Iterable[str]] = None, *, rule: Optional[BaseRule] = None) -> None:
         self.__name__ = name
         self.rule = rule
@@ -37,6 +39,8 @@ class AbstractCommand(ABC):
 
 
 class FunctionCommand(AbstractCommand, Generic[P, R]):
+    __slots__ = ["__func__", "__signature__", "__doc__", "_help_cache"]
+
     def __init__(
         self,
         name: str,
@@ -50,6 +54,7 @@ class FunctionCommand(AbstractCommand, Generic[P, R]):
         self.__func__ = func
         self.__doc__ = getattr(func, "__doc__", None)
         self.__signature__ = signature(func)
+        self._help_cache: Optional[Tuple[tuple, str]] = None
 
     def parse_message(self, message: Message) -> Tuple[tuple, dict]:
         args, kwargs = message.extract_handler_params(self.__signature__, name=self.name)
@@ -87,11 +92,18 @@ class FunctionCommand(AbstractCommand, Generic[P, R]):
         return result
     
     def format_help(self) -> str:
+        # alias and __doc__ are public attributes, so the cache is keyed on them
+        key = (self.name, self.alias, self.__doc__)
+        if self._help_cache is not None and self._help_cache[0] == key:
+            return self._help_cache[1]
         if self.__doc__ is None:
-            return super().format_help()
-        if not self.alias:
-            return f"{self.name} - {self.__doc__.strip().splitlines()[0]}"
-        return f"{self.name} (alias: {','.join(self.alias)}) - {self.__doc__.strip()}"
+            help = super().format_help()
+        elif not self.alias:
+            help = f"{self.name} - {self.__doc__.strip().splitlines()[0]}"
+        else:
+            help = f"{self.name} (alias: {','.join(self.alias)}) - {self.__doc__.strip()}"
+        self._help_cache = (key, help)
+        return help
 
     def __call__(self, *args: P.args, **kwds: P.kwargs) -> R:
         return self.__func__(*args, **kwds)
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Iterable, List, Optional, Tuple, Union
 
-from ..text import BaseText, Message, Mention, Quote
+from ..text import BaseText, Message, Mention, PlainText, Quote
 
 
 class AbstractCommandParser(ABC):
@@ -45,12 +45,17 @@ class SimpleCommandParser(AbstractCommandParser):
         return name, text[i+1:]
     
     def precheck(self, message: Message) -> bool:
-        text = message.text.split()
+        text = message.text
+        if isinstance(text, (str, PlainText)):
+            # fast path: only the leading token matters, no need to split the whole text
+            name = str(text).lstrip()
+            return bool(name) and name.startswith(self.prefixs)
+        text = text.split()
         for t in text:
             if isinstance(t, (Mention, Quote)):
                 continue
             name = str(t).strip()
-            return any(name.startswith(prefix) for prefix in self.prefixs)
+            return name.startswith(self.prefixs)
         return False
     
     def check_name(self, name: str) -> bool:
@@ -244,7 +244,7 @@ class QuoteRule(BaseRule):
     A rule that matches messages containing a quote.
     """
 
-    __slots__ = ["topic", "mention", "reply"]
+    __slots__ = ["mention", "reply"]
 
     def __init__(self, /, mention: Optional[str] = None, reply: Optional[int] = None) -> None:
         self.mention = mention
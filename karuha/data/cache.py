@@ -1,5 +1,5 @@
-from typing import (FrozenSet, Iterable, List, Optional, Tuple, TypeVar, Union,
-                    overload)
+from typing import (Any, Dict, FrozenSet, Iterable, List, Optional, Tuple,
+                    TypeVar, Union, overload)
 from typing_extensions import deprecated
 
 from pydantic import BaseModel
@@ -36,13 +36,24 @@ def _update_model(raw: Optional[T], model: Optional[T]) -> Optional[T]:  # noqa:
         return model
     elif model is None:
         return
-    model_data = model.model_dump(exclude_defaults=True, exclude_none=True)
+    model_data = _explicit_fields(model)
     if type(raw) is not type(model) and issubclass(type(raw), type(model)):
         return raw.model_copy(update=model_data)
-    raw_data = raw.model_dump(exclude_defaults=True, exclude_none=True)
+    raw_data = _explicit_fields(raw)
     return model.model_copy(update=dict(raw_data, **model_data))
 
 
+def _explicit_fields(model: BaseModel) -> Dict[str, Any]:
+    # top-level equivalent of model_dump(exclude_defaults=True, exclude_none=True)
+    # without serializing nested models, which model_copy would store as plain dicts
+    fields = type(model).model_fields
+    return {
+        name: value
+        for name in fields
+        if (value := getattr(model, name)) is not None and value != fields[name].default
+    }
+
+
 class UserCache(UserBoundDataModel):
     desc: Optional[BaseDesc] = None
     tags: Optional[UserTags] = None
@@ -81,10 +92,10 @@ def update_user_cache(
     cred: Optional[UserCreds] = None,
 ) -> None:
     logger.debug(f"Updating user cache for {user_id}")
-    if user_id not in user_cache:
+    cache = user_cache.get(user_id)
+    if cache is None:
         user_cache.add(UserCache(user_id=user_id, desc=desc, tags=tags, cred=cred))
         return
-    cache = user_cache[user_id]
     cache.desc = _update_model(cache.desc, desc)
     cache.tags = tags or cache.tags
     cache.cred = cred or cache.cred
@@ -96,10 +107,10 @@ def update_group_cache(
     tags: Optional[List[str]] = None,
 ) -> None:
     logger.debug(f"Updating group cache for {topic}")
-    if topic not in group_cache:
+    cache = group_cache.get(topic)
+    if cache is None:
         group_cache.add(GroupTopicCache(topic=topic, desc=desc, tags=tags))
         return
-    cache = group_cache[topic]
     cache.desc = _update_model(cache.desc, desc)
     cache.tags = tags or cache.tags
 
@@ -107,28 +118,28 @@ def update_group_cache(
 def update_p2p_cache(user1_id: str, user2_id: str, desc: P2PTopicDesc) -> None:
     logger.debug(f"Updating p2p cache for {user1_id} and {user2_id}")
     user_pair = frozenset((user1_id, user2_id))
-    if user_pair not in p2p_cache:
+    cache = p2p_cache.get(user_pair)
+    if cache is None:
         p2p_cache.add(P2PTopicCache(user_pair=user_pair, desc=desc))
         return
-    cache = p2p_cache[user_pair]
     cache.desc = _update_model(cache.desc, desc)
 
 
 def update_sub_cache(topic: str, user_id: str, sub: BaseSubscription) -> None:
     logger.debug(f"Updating sub cache for {user_id} in {topic}")
-    if (topic, user_id) not in subscription_cache:
+    cache = subscription_cache.get((topic, user_id))
+    if cache is None:
         subscription_cache.add(SubscriptionCache(topic=topic, user_id=user_id, sub=sub))
         return
-    cache = subscription_cache[topic, user_id]
     cache.sub = _update_model(cache.sub, sub)
 
 
 def update_message_cache(message: Message) -> None:
     logger.debug(f"Updating message cache for {message.seq_id} in {message.topic}")
-    if (message.topic, message.seq_id) not in message_cache:
+    cache = message_cache.get((message.topic, message.seq_id))
+    if cache is None:
         message_cache.add(MessageCache(topic=message.topic, seq_id=message.seq_id, message=message))
         return
-    cache = message_cache[message.topic, message.seq_id]
     cache.message = message
 
 
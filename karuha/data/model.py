@@ -1,6 +1,7 @@
 import base64
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Type, TypeVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple, Type, TypeVar
 from typing_extensions import Annotated
 
 from pydantic.annotated_handlers import GetCoreSchemaHandler
@@ -47,6 +48,37 @@ else:
             return type(other) is type(self)
 
 
+_PERMISSION_FIELDS = {
+    "J": "join",
+    "R": "read",
+    "W": "write",
+    "P": "presence",
+    "A": "approve",
+    "S": "sharing",
+    "D": "delete",
+    "O": "owner",
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_permission(value: str) -> Tuple[str, ...]:
+    # permission strings on the wire come from a tiny alphabet and repeat a lot
+    value = value.upper()
+    if value == "N":
+        return ()
+    try:
+        return tuple(_PERMISSION_FIELDS[i] for i in value)
+    except KeyError as e:
+        raise ValueError(f"unknown permission: {e.args[0]}") from None
+
+
+# bit i of the index is set when the i-th permission in _PERMISSION_FIELDS is granted
+_PERMISSION_STRINGS = tuple(
+    ''.join(c for b, c in enumerate(_PERMISSION_FIELDS) if i >> b & 1) or "N"
+    for i in range(256)
+)
+
+
 class AccessPermission(BaseModel):
     """
     User's access to a topic is defined by two sets of permissions:
@@ -84,53 +116,21 @@ class AccessPermission(BaseModel):
     def validate_permission(cls, value: Any) -> Any:
         if not isinstance(value, str):
             return value
-        value = value.upper()
-        result = {}
-        if value == "N":
-            return result
-        for i in value:
-            if i == "J":
-                result["join"] = True
-            elif i == "R":
-                result["read"] = True
-            elif i == "W":
-                result["write"] = True
-            elif i == "P":
-                result["presence"] = True
-            elif i == "A":
-                result["approve"] = True
-            elif i == "S":
-                result["sharing"] = True
-            elif i == "D":
-                result["delete"] = True
-            elif i == "O":
-                result["owner"] = True
-            else:
-                raise ValueError(f"unknown permission: {i}")
-        return result
+        return dict.fromkeys(_parse_permission(value), True)
 
     @model_serializer(mode="plain")
     def serialize_permission(self) -> str:
-        result = ""
-        if self.join:
-            result += "J"
-        if self.read:
-            result += "R"
-        if self.write:
-            result += "W"
-        if self.presence:
-            result += "P"
-        if self.approve:
-            result += "A"
-        if self.sharing:
-            result += "S"
-        if self.delete:
-            result += "D"
-        if self.owner:
-            result += "O"
-        if not result:
-            return "N"
-        return result
+        index = (
+            self.join
+            | self.read << 1
+            | self.write << 2
+            | self.presence << 3
+            | self.approve << 4
+            | self.sharing << 5
+            | self.delete << 6
+            | self.owner << 7
+        )
+        return _PERMISSION_STRINGS[index]
 
 
 class Cred(BaseModel):
@@ -17,9 +17,11 @@ def _leave_topic(bot: Bot, topic: str) -> None:
 
 
 def has_sub(bot: Bot, topic: str) -> bool:
-    if topic == bot.uid:
+    uid = bot.uid
+    if topic == uid:
         topic = "me"
-    return topic in _subscriptions[bot.uid]
+    # avoid creating an empty entry in the defaultdict for bots without subscriptions
+    return topic in _subscriptions.get(uid, ())
 
 
 async def ensure_sub(bot: Bot, topic: str) -> bool:
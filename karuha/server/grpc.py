@@ -1,5 +1,6 @@
 import sys
 from asyncio import Queue
+from logging import DEBUG
 from typing import AsyncGenerator
 
 import grpc
@@ -45,13 +46,16 @@ class GRPCServer(BaseServer, type="grpc"):
         if msg == grpc.aio.EOF:  # pragma: no cover
             self.logger.info("server closed connection")
             raise StopAsyncIteration(msg)
-        self.logger.debug(f"in: {msg}")
+        if self.logger.isEnabledFor(DEBUG):
+            # formatting a protobuf message is costly, skip it unless it will be logged
+            self.logger.debug(f"in: {msg}")
         return msg
 
     async def _message_generator(self) -> AsyncGenerator[pb.ClientMsg, None]:  # pragma: no cover
         while self._running:
             msg: pb.ClientMsg = await self.queue.get()
-            self.logger.debug(f"out: {msg}")
+            if self.logger.isEnabledFor(DEBUG):
+                self.logger.debug(f"out: {msg}")
             yield msg
 
     def _get_channel(self) -> grpc.aio.Channel:
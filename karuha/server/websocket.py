@@ -1,5 +1,6 @@
 import asyncio
 import sys
+from logging import DEBUG
 
 from aiohttp import (ClientConnectionError, WebSocketError,
                      WSServerHandshakeError)
@@ -48,7 +49,9 @@ class WebsocketServer(BaseServer, type="websocket"):
     async def send(self, msg: pb.ClientMsg) -> None:
         self._ensure_running()
         data = msg2dict(msg)
-        self.logger.debug(f"out: {to_json(data, indent=4).decode()}")
+        if self.logger.isEnabledFor(DEBUG):
+            # pretty-printing the payload is costly, skip it unless it will be logged
+            self.logger.debug(f"out: {to_json(data, indent=4).decode()}")
         try:
             await self.request.send_str(to_json(data).decode())
         except WebSocketError as e:  # pragma: no cover
@@ -63,5 +66,6 @@ class WebsocketServer(BaseServer, type="websocket"):
         except WebSocketError as e:  # pragma: no cover
             self.logger.error("websocket receive error", exc_info=sys.exc_info())
             raise self.exc_type("websocket receive error") from e
-        self.logger.debug(f"in: {to_json(data, indent=4).decode()}")
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f"in: {to_json(data, indent=4).decode()}")
         return dict2msg(data, pb.ServerMsg, ignore_unknown_fields=True)
@@ -239,7 +239,8 @@ class BaseSession(object):
                 pred_resp.append({i.name: 1 if i.val is None else i.val})
             else:
                 pred_resp.append(None)
-            chain += TextChain(NewLine, i)
+            chain += NewLine
+            chain += i
 
         async with get_message_lock():
             # Obtain the message lock to ensure that the returned message is intercepted by the dispatcher
@@ -3,14 +3,16 @@ import os
 import warnings
 from abc import abstractmethod
 from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from inspect import Parameter, isabstract
-from typing import (Any, ClassVar, Deque, Dict, Generic, Iterable, Iterator,
-                    List, Literal, Optional, Tuple, Type, TypeVar, Union, cast,
-                    overload)
+from operator import attrgetter
+from typing import (Any, Callable, ClassVar, Deque, Dict, Generator, Generic,
+                    Iterable, Iterator, List, Literal, Optional, Tuple, Type,
+                    TypeVar, Union, cast, overload)
 from weakref import WeakKeyDictionary, WeakSet
 
 from aiofiles import open as aio_open
-from aiofiles import os as aio_os
 from aiofiles import ospath as aio_ospath
 from pydantic import (BaseModel, Field, StrictInt, StrictStr, TypeAdapter,
                       model_validator)
@@ -32,14 +34,27 @@ _PkFlagObj = object()
 PrimaryKey = Annotated[T, Field(frozen=True), _PkFlagObj]
 
 
-def is_pk_annotation(annotation: Any) -> bool:
+def _is_pk_annotation(annotation: Any) -> bool:
     if get_origin(annotation) is not Annotated:
         return False
     return _PkFlagObj in get_args(annotation)
 
 
+_cached_is_pk_annotation = lru_cache(maxsize=1024)(_is_pk_annotation)
+
+
+def is_pk_annotation(annotation: Any) -> bool:
+    try:
+        return _cached_is_pk_annotation(annotation)
+    except TypeError:
+        # annotation is not hashable
+        return _is_pk_annotation(annotation)
+
+
 class DataModel(BaseModel, validate_assignment=True):
     __primary_key__: ClassVar[Optional[Tuple[str, ...]]] = None
+    # attrgetter returns a single value for one key and a tuple for several
+    __pk_getter__: ClassVar[Optional[Callable[[Any], Any]]] = None
 
     data_store: Annotated[Optional["AbstractDataStore[Self]"], Field(exclude=True)] = None
 
@@ -71,9 +86,9 @@ class DataModel(BaseModel, validate_assignment=True):
         return self
 
     def get_primary_key(self) -> Any:
-        assert self.__class__.__primary_key__ is not None, "primary key not defined"
-        pk = tuple(getattr(self, key) for key in self.__class__.__primary_key__)
-        return pk[0] if len(pk) == 1 else pk
+        getter = self.__class__.__pk_getter__
+        assert getter is not None, "primary key not defined"
+        return getter(self)
 
     @model_validator(mode="after")
     def validate_model_update(self) -> Self:
@@ -112,6 +127,7 @@ class DataModel(BaseModel, validate_assignment=True):
         if pk:
             pk_inherited.extend(filter(lambda x: x not in pk_inherited, pk))
         cls.__primary_key__ = tuple(pk_inherited) or None
+        cls.__pk_getter__ = attrgetter(*pk_inherited) if pk_inherited else None
 
 
 class TopicBoundDataModel(DataModel):
@@ -289,7 +305,8 @@ class AbstractCachedDataStore(AbstractDataStore[T_Data]):
     def __init__(self, name: str, *, data_type: Optional[Type[T_Data]] = None) -> None:
         super().__init__(name, data_type=data_type)
         self._indexd_data: Dict[Any, T_Data] = {}
-        self._data: List[T_Data] = []
+        # data without primary key, keyed by id() for O(1) membership and removal
+        self._data: Dict[int, T_Data] = {}
 
     @abstractmethod
     def prepare_data(self) -> None:
@@ -313,7 +330,7 @@ class AbstractCachedDataStore(AbstractDataStore[T_Data]):
         if data.__primary_key__ is not None:
             self._indexd_data[data.get_primary_key()] = data
         else:
-            self._data.append(data)
+            self._data[id(data)] = data
         if sync:
             self.update_data()
 
@@ -324,7 +341,7 @@ class AbstractCachedDataStore(AbstractDataStore[T_Data]):
     def get_all(self, *, sync: bool = True) -> List[T_Data]:
         if sync:
             self.prepare_data()
-        return self._data.copy() + list(self._indexd_data.values())
+        return [*self._data.values(), *self._indexd_data.values()]
 
     def discard(self, data: T_Data, /, *, sync: bool = True) -> bool:
         if sync:
@@ -333,11 +350,8 @@ class AbstractCachedDataStore(AbstractDataStore[T_Data]):
             ret = self._indexd_data.pop(data.get_primary_key(), None)
             if ret is None:
                 return False
-        else:
-            try:
-                self._data.remove(data)
-            except ValueError:
-                return False
+        elif self._data.pop(id(data), None) is None:
+            return False
         if sync:
             self.update_data()
         return True
@@ -348,7 +362,7 @@ class AbstractCachedDataStore(AbstractDataStore[T_Data]):
         if data.__primary_key__ is not None:
             del self._indexd_data[data.get_primary_key()]
         else:
-            self._data.remove(data)
+            del self._data[id(data)]
         if sync:
             self.update_data()
 
@@ -382,12 +396,12 @@ class AbstractCachedDataStore(AbstractDataStore[T_Data]):
             if __key.__primary_key__ is not None:
                 return __key.get_primary_key() in self._indexd_data
             else:
-                return __key in self._data
+                return id(__key) in self._data
         return __key in self._indexd_data
 
     def __iter__(self) -> Iterator[T_Data]:
         self.prepare_data()
-        yield from self._data
+        yield from self._data.values()
         yield from self._indexd_data.values()
 
     def __len__(self) -> int:
@@ -501,7 +515,10 @@ class LruStore(AbstractDataStore[T_Data], store_type="lru"):
 
 
 class AbstractAsyncCachedStore(AbstractCachedDataStore[T_Data]):
-    __slots__ = ["_load_tasks", "_save_tasks", "_wait_list", "_loaded"]
+    __slots__ = [
+        "_load_tasks", "_save_tasks", "_wait_list", "_loaded",
+        "_save_task", "_dirty", "_batch_depth", "_batch_changed",
+    ]
 
     enable_async_backend: ClassVar[bool] = greenback is not None
 
@@ -515,6 +532,10 @@ class AbstractAsyncCachedStore(AbstractCachedDataStore[T_Data]):
             WeakKeyDictionary()
         )
         self._loaded = False
+        self._save_task: Optional[asyncio.Task] = None
+        self._dirty = False
+        self._batch_depth = 0
+        self._batch_changed = False
 
         try:
             task = asyncio.current_task()
@@ -540,7 +561,13 @@ class AbstractAsyncCachedStore(AbstractCachedDataStore[T_Data]):
 
     def save_backend(self) -> None:
         assert self.enable_async_backend, "async backend task is not enabled"
-        self._save_tasks.add(asyncio.create_task(self.save()))
+        self._dirty = True
+        task = self._save_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            # the running save task will pick up the latest data
+            return
+        self._save_task = asyncio.create_task(self._save_pending())
+        self._save_tasks.add(self._save_task)
 
     async def wait_tasks(self, *, load: bool = True, save: bool = True) -> None:
         if load:
@@ -548,6 +575,11 @@ class AbstractAsyncCachedStore(AbstractCachedDataStore[T_Data]):
         if save:
             await self._wait_tasks(self._save_tasks)
 
+    async def _save_pending(self) -> None:
+        while self._dirty:
+            self._dirty = False
+            await self.save()
+
     def wait_tasks_sync(self, *, load: bool = True, save: bool = True) -> None:
         if not self._should_wait(load=load, save=save):
             return
@@ -594,8 +626,23 @@ class AbstractAsyncCachedStore(AbstractCachedDataStore[T_Data]):
         self.wait_tasks_sync(load=True, save=False)
 
     def update_data(self) -> None:
+        if self._batch_depth:
+            self._batch_changed = True
+            return
         self.save_backend()
 
+    @contextmanager
+    def batch(self) -> Generator[Self, None, None]:
+        """defer saving until the outermost batch exits, then save once if anything changed"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_changed:
+                self._batch_changed = False
+                self.save_backend()
+
     @staticmethod
     def async_backend_available() -> bool:
         return greenback is not None and greenback.has_portal()
@@ -634,10 +681,10 @@ class AbstractSimpleFileDataStore(AbstractAsyncCachedStore[T_Data]):
             self.decode_data(await f.read())
 
     async def save(self) -> None:
-        await aio_os.makedirs(os.path.dirname(self.path), exist_ok=True)
         await self.wait_tasks(save=False)
-        async with aio_open(self.path, "wb") as f:
-            await f.write(self.encode_data())
+        data = self.encode_data()
+        # a single executor hop instead of one per aiofiles call (makedirs, open, write, close)
+        await asyncio.get_running_loop().run_in_executor(None, self._write_file, data)
 
     def load_backend(self) -> None:
         if not self.enable_async_backend:
@@ -655,18 +702,31 @@ class AbstractSimpleFileDataStore(AbstractAsyncCachedStore[T_Data]):
         if not os.path.exists(self.path):  # pragma: no cover
             return
         self.wait_tasks_sync()
-        with open(self.path, "rb") as f:
-            self.decode_data(f.read())
+        self.decode_data(self._read_file())
 
     def _save_sync(self) -> None:
-        os.makedirs(os.path.dirname(self.path), exist_ok=True)
         self.wait_tasks_sync()
+        self._write_file(self.encode_data())
+
+    def _read_file(self) -> bytes:
+        # unbuffered: the file is read whole, so a BufferedReader would only add a copy
+        fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            data = os.read(fd, os.fstat(fd).st_size)
+            while chunk := os.read(fd, 65536):
+                data += chunk
+        finally:
+            os.close(fd)
+        return data
+
+    def _write_file(self, data: bytes) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
         with open(self.path, "wb") as f:
-            f.write(self.encode_data())
+            f.write(data)
 
 
 class JsonFileStore(AbstractSimpleFileDataStore[T_Data], store_type="json"):
-    __slots__ = ["dump_kwds"]
+    __slots__ = ["dump_kwds", "_type_adapter"]
 
     def __init__(
         self,
@@ -678,17 +738,23 @@ class JsonFileStore(AbstractSimpleFileDataStore[T_Data], store_type="json"):
         **dump_kwds: Any,
     ) -> None:
         self.dump_kwds = dump_kwds
+        self._type_adapter: Optional[TypeAdapter[List[T_Data]]] = None
         super().__init__(name, path_format, data_type=data_type)
 
+    @property
+    def type_adapter(self) -> TypeAdapter[List[T_Data]]:
+        # building a TypeAdapter compiles a new core schema, so reuse it across saves
+        if self._type_adapter is None:
+            self._type_adapter = TypeAdapter(List[self.data_type])
+        return self._type_adapter
+
     def encode_data(self) -> bytes:
-        type_adapter = TypeAdapter(List[self.data_type])
-        return type_adapter.dump_json(self.get_all(sync=False), **self.dump_kwds)
+        return self.type_adapter.dump_json(self.get_all(sync=False), **self.dump_kwds)
 
     def decode_data(self, data: bytes) -> None:
         if not data:  # pragma: no cover
             return
-        type_adapter = TypeAdapter(List[self.data_type])
-        data_list = cast(List[T_Data], type_adapter.validate_json(data))
+        data_list = cast(List[T_Data], self.type_adapter.validate_json(data))
         for i in data_list:
             self.add(i, copy=False, sync=False)
 
@@ -5,11 +5,11 @@ from .drafty import DraftyExtend, Drafty, InlineType, ExtendType
 from .textchain import BaseText, Mention, PlainText, InlineCode, TextChain, Form, _ExtensionText, _Container
 
 
+_tp_weights: Dict[str, int] = {tp: i for i, tp in enumerate(InlineType.__args__)}  # type: ignore
+
+
 def _tp_weight(tp: str) -> int:
-    args: list = InlineType.__args__  # type: ignore
-    if tp in args:
-        return args.index(tp)
-    return 0
+    return _tp_weights.get(tp, 0)
 
 
 class Span:
@@ -43,9 +43,12 @@ class Span:
         return f"<span {self.tp} {self.start}-{self.end} with {len(self.children)} children>"
 
 
-def to_span_tree(spans: Optional[List[Span]]) -> List[Span]:
-    if not spans:
-        return []
+def _span_sort_key(span: Span) -> Tuple[int, int, int]:
+    # same order as Span.__gt__, without a python-level comparison per pair
+    return span.start, -span.end, -_tp_weight(span.tp)
+
+
+def _group_spans(spans: List[Span]) -> List[Span]:
     sp_iter = iter(spans)
     last = next(sp_iter)
     tree = [last]
@@ -57,9 +60,21 @@ def to_span_tree(spans: Optional[List[Span]]) -> List[Span]:
             if last.children is None:
                 last.children = []
             last.children.append(i)
-    
-    for i in tree:
-        i.children = to_span_tree(i.children)
+    return tree
+
+
+def to_span_tree(spans: Optional[List[Span]]) -> List[Span]:
+    if not spans:
+        return []
+    tree = _group_spans(spans)
+    stack = list(tree)
+    while stack:
+        span = stack.pop()
+        if span.children:
+            span.children = _group_spans(span.children)
+            stack.extend(span.children)
+        else:
+            span.children = []
     return tree
 
 
@@ -81,7 +96,7 @@ def eval_spans(drafty: Drafty) -> Tuple[List[Span], List[DraftyExtend]]:
         else:
             tp = i.tp
         spans.append(Span(tp, i.at, i.at + i.len, data))
-    spans.sort()
+    spans.sort(key=_span_sort_key)
     return spans, attachments
 
 
@@ -40,17 +40,21 @@ class Drafty(BaseModel):
 
     @classmethod
     def from_str(cls, string: str) -> Self:
-        return cls(txt=string)
+        return cls.model_construct(txt=string)
+
+    def _copy_lists(self) -> Self:
+        # __iadd__ extends fmt and ent in place, which must not leak into the source
+        return self.model_copy(update={"fmt": self.fmt.copy(), "ent": self.ent.copy()})
 
     def __add__(self, other: Union[str, "Drafty"]) -> Self:
-        obj = self.model_copy()
+        obj = self._copy_lists()
         obj += other
         return obj
     
     def __radd__(self, other: str) -> Self:
         if not isinstance(other, str):  # pragma: no cover
             return NotImplemented
-        obj = self.model_copy()
+        obj = self._copy_lists()
         obj.txt = other + obj.txt
         return obj
     
@@ -65,7 +69,7 @@ class Drafty(BaseModel):
         self.txt += other.txt
 
         if not k_base:
-            self.ent = other.ent
+            self.ent.extend(other.ent)
             self.fmt.extend(i.rebase(offset, 0) for i in other.fmt)
             return self
         repeat = {}
@@ -82,6 +86,12 @@ class Drafty(BaseModel):
         )
         return self
 
+    def __eq__(self, other: Any) -> bool:
+        # compare the three fields directly instead of pydantic's generic model comparison
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.txt == other.txt and self.fmt == other.fmt and self.ent == other.ent
+
     def __repr__(self) -> str:
         return f"<drafty message {self.txt!r}>"
     
@@ -50,27 +50,38 @@ class Message(HandlerInvokerModel, frozen=True, arbitrary_types_allowed=True):
     
     @staticmethod
     def parse_content(content: bytes) -> Tuple[Union[str, Drafty], Union[str, BaseText]]:
-        try:
-            raw_text = from_json(content)
-        except ValueError:
-            raw_text = content.decode(errors="ignore")
-            logger.warning(f"cannot decode text {raw_text!r}")
+        drafty = None
+        if content[:1] == b"{":
+            # validate drafty directly from json without building an intermediate dict;
+            # anything unusual falls back to the generic path below
+            try:
+                drafty = Drafty.model_validate_json(content)
+            except ValueError:
+                pass
         
-        if isinstance(raw_text, str):
-            return raw_text, PlainText(raw_text)
+        if drafty is None:
+            try:
+                raw_text = from_json(content)
+            except ValueError:
+                raw_text = content.decode(errors="ignore")
+                logger.warning(f"cannot decode text {raw_text!r}")
+            
+            if isinstance(raw_text, str):
+                return raw_text, PlainText(raw_text)
+            
+            try:
+                drafty = Drafty.model_validate(raw_text)
+            except Exception:
+                logger.warning(f"unknown text format {raw_text!r}", exc_info=sys.exc_info())
+                raw_text = str(raw_text)
+                return raw_text, raw_text
         
         try:
-            raw_text = Drafty.model_validate(raw_text)
-        except Exception:
-            logger.warning(f"unknown text format {raw_text!r}", exc_info=sys.exc_info())
-            raw_text = text = str(raw_text)
-        else:
-            try:
-                text = drafty2text(raw_text)
-            except Exception:  # pragma: no cover
-                logger.error(f"cannot decode drafty {raw_text!r}")
-                text = raw_text.txt
-        return raw_text, text
+            text = drafty2text(drafty)
+        except Exception:  # pragma: no cover
+            logger.error(f"cannot decode drafty {drafty!r}")
+            text = drafty.txt
+        return drafty, text
     
     def get_dependency(self, param: Parameter, /, **kwds: Any) -> Any:
         if param.name == "text":
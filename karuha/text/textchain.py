@@ -1,6 +1,8 @@
 import asyncio
+import mmap
 import operator as op
 import os
+import stat
 from abc import abstractmethod
 from base64 import b64decode, b64encode
 from io import BytesIO
@@ -89,10 +91,11 @@ class _Text(BaseText):
     def to_drafty(self) -> Drafty:
         start = 0
         fmt = []
+        # fields are built from trusted values here, so skip validation
         while (p := self.text.find('\n', start)) != -1:
-            fmt.append(DraftyFormat(at=p, len=1, tp="BR"))
+            fmt.append(DraftyFormat.model_construct(at=p, len=1, tp="BR"))
             start = p + 1
-        return Drafty(txt=self.text.replace('\n', ' '), fmt=fmt)
+        return Drafty.model_construct(txt=self.text.replace('\n', ' '), fmt=fmt)
 
     def __eq__(self, __value: Any) -> bool:
         if isinstance(__value, str):
@@ -116,12 +119,7 @@ class PlainText(_Text):
         return super().__add__(other)
     
     def split(self, /, sep: Optional[str] = None, maxsplit: SupportsIndex = -1) -> List[BaseText]:
-        result = []
-        for p in self.text.split(sep, maxsplit):
-            t = self.model_copy()
-            t.text = p
-            result.append(t)
-        return result
+        return [self.model_copy(update={"text": p}) for p in self.text.split(sep, maxsplit)]
 
     def __getitem__(self, index: Union[SupportsIndex, slice], /) -> "PlainText":
         return self.__class__(text=self.text[index])
@@ -170,7 +168,7 @@ class TextChain(BaseText, Sequence):
     
     def to_drafty(self) -> Drafty:
         if not self.contents:
-            return Drafty(txt=" ")
+            return Drafty.from_str(" ")
         it = iter(self.contents)
         base = next(it).to_drafty()
         for i in it:
@@ -207,7 +205,10 @@ class TextChain(BaseText, Sequence):
 
     def __getitem__(self, key: Union[SupportsIndex, slice], /) -> BaseText:
         item = self.contents[key]
-        return TextChain(*item) if isinstance(item, list) else item
+        if isinstance(item, list):
+            # a slice of contents is already flattened, no need to re-run __init__
+            return TextChain.model_construct(contents=item)
+        return item
 
     def __iter__(self) -> Generator[BaseText, None, None]:
         yield from self.contents
@@ -503,16 +504,31 @@ class _Attachment(_ExtensionText):
             ref: Optional[str] = None,
             **kwds: Any
     ) -> Self:
+        loop = asyncio.get_running_loop()
         if mime is None:
-            loop = asyncio.get_running_loop()
             mime = await loop.run_in_executor(None, from_file, path, True)
-        async with aio_open(path, "rb") as f:
-            return cls.from_bytes(
-                await f.read(),
-                mime=mime, name=name or os.path.basename(path),
-                ref=ref,
-                **kwds
-            )
+        val, size = await loop.run_in_executor(None, cls._encode_file, path)
+        return cls(
+            mime=mime,
+            name=name or os.path.basename(path),
+            ref=ref,
+            val=val,
+            size=size,
+            **kwds
+        )
+
+    @staticmethod
+    def _encode_file(path: Union[str, os.PathLike]) -> Tuple[str, int]:
+        # encode from a read-only mapping instead of reading the file into a bytes copy first
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or not st.st_size:
+                # pipes, /proc files and empty files cannot be mapped,
+                # and st_size does not tell whether they have content
+                data = f.read()
+                return b64encode(data).decode("ascii"), len(data)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return b64encode(mm).decode("ascii"), st.st_size
     
     @classmethod
     async def analyze_bytes(cls, data: bytes, *, name: Optional[str] = None) -> Dict[str, Any]:
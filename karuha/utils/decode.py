@@ -1,4 +1,5 @@
 import base64
+from functools import lru_cache
 from typing import Any, Dict, Iterable, Mapping, Type, TypeVar, Union, cast
 
 from google.protobuf.descriptor import Descriptor, FieldDescriptor
@@ -25,7 +26,9 @@ def decode_mapping(data: Mapping[str, bytes]) -> Dict[str, Any]:
 T_Msg = TypeVar("T_Msg", bound=Message)
 
 
+@lru_cache(maxsize=None)
 def _is_map_entry(desc: Descriptor) -> bool:
+    # descriptors are static, so the options lookup only has to run once per message type
     if not desc.has_options or not desc.GetOptions().map_entry:
         return False
     key_field: FieldDescriptor = desc.fields_by_name["key"]
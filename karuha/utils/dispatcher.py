@@ -52,16 +52,16 @@ class AbstractDispatcher(_ContextHelper, Generic[T]):
     
     @classmethod
     def dispatch(cls, message: T, /, threshold: float = 0.4, filter: Optional[Callable[[Self], bool]] = None) -> Optional[Any]:
-        dispatchers = cls.dispatchers
-        if filter is not None:
-            dispatchers = {d for d in dispatchers if filter(d)}
-        if not dispatchers:
-            return
-        selected, match_rate = max(
-            map(lambda d: (d, d.match(message)), dispatchers),
-            key=lambda x: x[1],
-        )
-        if match_rate < threshold:
+        # single pass, without building a filtered set or (dispatcher, rate) pairs
+        selected = None
+        match_rate = 0.0
+        for d in cls.dispatchers:
+            if filter is not None and not filter(d):
+                continue
+            rate = d.match(message)
+            if selected is None or rate > match_rate:
+                selected, match_rate = d, rate
+        if selected is None or match_rate < threshold:
             return
         elif selected.once:
             selected.deactivate()
@@ -28,12 +28,19 @@ class EventCatcher(Generic[T_Event], _ContextHelper):
         while True:
             if self.events:
                 ev = self.events.pop()
+            elif timeout is not None and timeout <= 0:
+                # nothing caught and no time to wait, skip creating the future
+                raise asyncio.TimeoutError
             else:
                 assert self.future is None, "catcher is already waited"
                 loop = asyncio.get_running_loop()
                 self.future = loop.create_future()
                 try:
-                    ev = await asyncio.wait_for(self.future, timeout)
+                    if timeout is None:
+                        # wait_for builds a timeout scope even without a deadline on 3.12+
+                        ev = await self.future
+                    else:
+                        ev = await asyncio.wait_for(self.future, timeout)
                 finally:
                     self.future = None
 
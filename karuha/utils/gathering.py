@@ -86,9 +86,9 @@ class DynamicGatheringFuture(asyncio.Future):
         if self.nfinished == len(self.children):
             # All futures are done; create a list of results
             # and set it to the 'outer' future.
-            results = []
+            results = [None] * len(self.children)
 
-            for fut in self.children:
+            for i, fut in enumerate(self.children):
                 if fut.cancelled():  # pragma: no cover
                     # Check if 'fut' is cancelled first, as
                     # 'fut.exception()' will *raise* a CancelledError
@@ -100,7 +100,7 @@ class DynamicGatheringFuture(asyncio.Future):
                     res = fut.exception()
                     if res is None:
                         res = fut.result()
-                results.append(res)
+                results[i] = res
 
             if self._cancel_requested:  # pragma: no cover
                 # If gather is being cancelled we must propagate the
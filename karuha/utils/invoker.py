@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
 from dataclasses import is_dataclass
-from inspect import Parameter, Signature
-from types import new_class
+from functools import lru_cache
+from inspect import Parameter, Signature, isfunction
+from types import MethodType, new_class
 from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Type, TypeVar
+from weakref import WeakKeyDictionary
 from typing_extensions import Annotated, Self, get_args, get_origin, is_typeddict
 
 from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler, TypeAdapter
@@ -13,6 +15,7 @@ from ..exception import KaruhaHandlerInvokerError
 
 T = TypeVar("T")
 EMPTY = Parameter.empty
+_VAR_KINDS = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
 
 
 def _type_has_config(type_: Any) -> bool:
@@ -24,6 +27,63 @@ def _type_has_config(type_: Any) -> bool:
         return False
 
 
+def _build_type_adapter(annotation: Any) -> TypeAdapter:
+    config: Optional[ConfigDict] = (
+        None if _type_has_config(annotation) else {"arbitrary_types_allowed": True}
+    )
+    return TypeAdapter(annotation, config=config)
+
+
+_cached_type_adapter = lru_cache(maxsize=1024)(_build_type_adapter)
+
+
+def get_type_adapter(annotation: Any) -> TypeAdapter:
+    """Returns a TypeAdapter for the annotation, cached for hashable annotations."""
+    try:
+        return _cached_type_adapter(annotation)
+    except TypeError:
+        # annotation is not hashable
+        return _build_type_adapter(annotation)
+
+
+_signature_cache: "WeakKeyDictionary[Callable, Signature]" = WeakKeyDictionary()
+
+
+def _function_signature(func: Callable) -> Signature:
+    try:
+        return _signature_cache[func]
+    except KeyError:
+        pass
+    except TypeError:
+        # func cannot be weakly referenced
+        return Signature.from_callable(func)
+    sig = _signature_cache[func] = Signature.from_callable(func)
+    return sig
+
+
+def _bound_signature(sig: Signature) -> Signature:
+    params = tuple(sig.parameters.values())
+    if params and params[0].kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+        return sig.replace(parameters=params[1:])
+    return sig
+
+
+def get_handler_signature(handler: Callable) -> Signature:
+    """
+    Returns the signature of the handler.
+
+    Signatures of plain functions and bound methods are cached weakly on the
+    underlying function, so bound methods created per call do not keep their
+    objects alive. Other callables may carry their own `__wrapped__` or
+    `__signature__`, so they are resolved by `Signature.from_callable` each time.
+    """
+    if isinstance(handler, MethodType) and isfunction(handler.__func__):
+        return _bound_signature(_function_signature(handler.__func__))
+    elif isfunction(handler):
+        return _function_signature(handler)
+    return Signature.from_callable(handler)
+
+
 class AbstractHandlerInvoker(ABC):
     __slots__ = []
 
@@ -42,11 +102,8 @@ class AbstractHandlerInvoker(ABC):
             "invoker": self,
             **kwds,
         }
-        config: Optional[ConfigDict] = (
-            None if _type_has_config(ann) else {"arbitrary_types_allowed": True}
-        )
         try:
-            return TypeAdapter(ann, config=config).validate_python(val, context=context)
+            return get_type_adapter(ann).validate_python(val, context=context)
         except Exception as e:
             raise KaruhaHandlerInvokerError(
                 f"failed to validate dependency '{param.name}':\n{e}"
@@ -93,10 +150,16 @@ class AbstractHandlerInvoker(ABC):
         )
 
     def extract_handler_params(self, sig: Signature, *, name: Optional[str] = None) -> Tuple[list, Dict[str, Any]]:
+        params = sig.parameters.values()
+        # reject unsupported signatures before resolving (possibly costly) dependencies
+        for param in params:
+            if param.kind in _VAR_KINDS:
+                raise KaruhaHandlerInvokerError(f"{param.kind} parameters are not supported")
+
         dependencies = {}
         missing = {}
         kwds = {"signature": sig, "identifier": name}
-        for param in sig.parameters.values():
+        for param in params:
             try:
                 val = self.get_dependency(param, **kwds)
             except KaruhaHandlerInvokerError as e:
@@ -104,21 +167,20 @@ class AbstractHandlerInvoker(ABC):
             else:
                 dependencies[param.name] = val
 
-        dependencies.update(self.resolve_missing_dependencies(missing, **kwds))
+        if missing:
+            dependencies.update(self.resolve_missing_dependencies(missing, **kwds))
         assert len(dependencies) == len(sig.parameters)
         args = []
         kwargs = {}
-        for param in sig.parameters.values():
-            if param.kind in [Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD]:
-                raise KaruhaHandlerInvokerError(f"{param.kind} parameters are not supported")
-            elif param.kind == Parameter.POSITIONAL_ONLY:
+        for param in params:
+            if param.kind is Parameter.POSITIONAL_ONLY:
                 args.append(dependencies[param.name])
             else:
                 kwargs[param.name] = dependencies[param.name]
         return args, kwargs
 
     def call_handler(self, handler: Callable[..., T]) -> T:
-        args, kwargs = self.extract_handler_params(Signature.from_callable(handler), name=getattr(handler, "__name__", None))
+        args, kwargs = self.extract_handler_params(get_handler_signature(handler), name=getattr(handler, "__name__", None))
         return handler(*args, **kwargs)
 
 
@@ -146,7 +208,7 @@ class HandlerInvokerModel(AbstractHandlerInvoker, BaseModel):
     __slots__ = []
 
     def get_dependency(self, param: Parameter, /, **kwds: Any) -> Any:
-        if param.name not in self.model_fields_set.union(self.model_computed_fields):
+        if param.name not in self.model_fields_set and param.name not in self.model_computed_fields:
             raise KaruhaHandlerInvokerError(f"dependency '{param.name}' is not in the model")
         try:
             val = getattr(self, param.name)
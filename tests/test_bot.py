@@ -10,7 +10,7 @@ from karuha.event.bot import (CtrlEvent, DataEvent, InfoEvent, LeaveEvent,
 from karuha.exception import KaruhaBotError
 from karuha.runner import remove_bot
 
-from .utils import TEST_TIMEOUT, AsyncBotTestCase, BotMock, MockServer, bot_mock_server
+from .utils import TEST_TIMEOUT, TEST_TOPIC, AsyncBotTestCase, BotMock, MockServer, bot_mock_server
 
 
 class TestBot(AsyncBotTestCase):
@@ -77,6 +77,10 @@ class TestBot(AsyncBotTestCase):
             await self.put_bot_received(pb.ServerMsg(info=message))
             e = await catcher.catch_event()
         self.assertEqual(e.server_message, message)
+
+    async def test_note_read(self) -> None:
+        await self.put_bot_content(b"\"Hello world!\"", seq_id=114)
+        await self.assert_note_read(TEST_TOPIC, 114)
     
     async def test_client_message(self) -> None:
         bot = self.bot
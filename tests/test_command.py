@@ -1,5 +1,6 @@
+from functools import update_wrapper
 from inspect import signature
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 from unittest import TestCase
 
 from pydantic_core import to_json
@@ -97,6 +98,27 @@ class TestCommand(TestCase):
         self.assertEqual(args, [PlainText("test")])
         self.assertEqual(kwargs, {"raw_text": Drafty(txt="test"), "content": b"{\"txt\": \"test\"}", "undefined": None})
 
+    def test_handler_signature(self) -> None:
+        class Handler:
+            def get_user(self, user_id: Optional[str]) -> Optional[str]:
+                return user_id
+
+        msg = new_test_command_message()
+        self.assertEqual(msg.call_handler(Handler().get_user), TEST_UID)
+
+        def get_user(user_id: Optional[str]) -> Optional[str]:
+            return user_id
+
+        class Wrapper:
+            def __init__(self, func: Callable[..., Any]) -> None:
+                update_wrapper(self, func)
+
+            def __call__(self, *args: Any, **kwds: Any) -> Any:
+                return self.__wrapped__(*args, **kwds)  # type: ignore
+
+        self.assertEqual(msg.call_handler(Wrapper(get_user)), TEST_UID)
+        self.assertEqual(msg.call_handler(FunctionCommand("get_user", get_user)), TEST_UID)
+
     def test_function_command(self) -> None:
         with new_collection() as clt:
             called = False
@@ -113,6 +135,7 @@ class TestCommand(TestCase):
                 called = True
 
             self.assertIsInstance(test, FunctionCommand)
+            self.assertFalse(hasattr(test, "__dict__"))
             self.assertIs(clt["test"], test)
             test(bot_mock, new_test_message(), text=PlainText("test"))
             self.assertTrue(called)
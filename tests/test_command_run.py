@@ -16,7 +16,7 @@ from .utils import TEST_TOPIC, AsyncBotTestCase
 
 @on_command(alias=("hello",))
 async def hi(session: MessageSession, text: str) -> None:
-    _, name = text.split(" ", 1)
+    name = text.partition(" ")[2]
     await session.send(f"Hello {name}!")
 
 
@@ -12,6 +12,14 @@ from karuha.data.user import BaseUser, User, get_user
 from .utils import AsyncBotTestCase
 
 
+_JSON_NOTE_TEST = to_json({"note": "test note"})
+_JSON_STAFF = to_json({"staff": True})
+_JSON_FN_TEST_GROUP = to_json({"fn": "Test Group"})
+_JSON_FN_TEST_USER = to_json({"fn": "Test User"})
+_JSON_FN_TEST_USER1 = to_json({"fn": "Test User1"})
+_JSON_TEST_GROUP = to_json({"fn": "Test Group", "note": "Test Group Note"})
+
+
 class TestData(AsyncBotTestCase):
     def test_access(self) -> None:
         self.assertEqual(
@@ -86,6 +94,20 @@ class TestData(AsyncBotTestCase):
         assert cache and isinstance(cache.desc, UserDesc)
         self.assertEqual(cache.desc.public, base_desc.public)
         self.assertEqual(cache.desc.created, desc.created)
+        self.assertEqual(cache.desc.trusted, desc.trusted)
+
+        partial_desc = UserDesc(
+            created=1709214504076,  # type: ignore
+            updated=1709466962755,  # type: ignore
+            state="ok"
+        )
+        update_user_cache(user_id="user", desc=partial_desc)
+        cache = user_cache.get("user")
+        assert cache and isinstance(cache.desc, UserDesc)
+        self.assertEqual(cache.desc.state, "ok")
+        self.assertEqual(cache.desc.public, base_desc.public)
+        self.assertEqual(cache.desc.trusted, desc.trusted)
+        self.assertEqual(cache.desc.updated, desc.updated)
 
     async def test_me_meta(self) -> None:
         task = asyncio.create_task(get_user(self.bot, skip_cache=True))
@@ -107,8 +129,8 @@ class TestData(AsyncBotTestCase):
                     want="JPS",
                     given="JPS"
                 ),
-                public=to_json({"note": "test note"}),
-                trusted=to_json({"staff": True}),
+                public=_JSON_NOTE_TEST,
+                trusted=_JSON_STAFF,
                 state="ok"
             )
         )
@@ -150,8 +172,8 @@ class TestData(AsyncBotTestCase):
                     ),
                     read_id=70,
                     recv_id=70,
-                    public=to_json({"fn": "Test Group"}),
-                    private=to_json({"note": "test note"}),
+                    public=_JSON_FN_TEST_GROUP,
+                    private=_JSON_NOTE_TEST,
                     topic="grp_test_1",
                     touched_at=1708326545004,
                     seq_id=70,
@@ -162,26 +184,28 @@ class TestData(AsyncBotTestCase):
         await self.put_bot_received(pb.ServerMsg(meta=meta))
         subs = await self.wait_for(task)
         self.assertEqual(len(subs), 2)
-        for sub in subs:
-            assert isinstance(sub, TopicSub)
-            if sub.topic == "grp_test_1":
-                self.assertEqual(sub.public, {"fn": "Test Group"})
-                self.assertIsNotNone(sub.touched)
-                self.assertEqual(sub.read, 70)
-                self.assertEqual(sub.recv, 70)
-                assert sub.acs
-                self.assertEqual(
-                    sub.acs.want,
-                    AccessPermission(
-                        join=True, read=True, write=True, presence=True, sharing=True
-                    ),
-                )
-            elif sub.topic == "usr_test_1":
-                self.assertIsNone(sub.public)
-                self.assertEqual(sub.read, 2)
-                self.assertEqual(sub.recv, 2)
-            else:
-                assert False, f"unexpected topic: {sub.topic}"
+        by_topic = {sub.topic: sub for sub in subs}
+        self.assertEqual(by_topic.keys(), {"grp_test_1", "usr_test_1"})
+
+        sub = by_topic["grp_test_1"]
+        assert isinstance(sub, TopicSub)
+        self.assertEqual(sub.public, {"fn": "Test Group"})
+        self.assertIsNotNone(sub.touched)
+        self.assertEqual(sub.read, 70)
+        self.assertEqual(sub.recv, 70)
+        assert sub.acs
+        self.assertEqual(
+            sub.acs.want,
+            AccessPermission(
+                join=True, read=True, write=True, presence=True, sharing=True
+            ),
+        )
+
+        sub = by_topic["usr_test_1"]
+        assert isinstance(sub, TopicSub)
+        self.assertIsNone(sub.public)
+        self.assertEqual(sub.read, 2)
+        self.assertEqual(sub.recv, 2)
         
         user = await get_user(self.bot, "usr_test_1")
         self.assertIsInstance(user, BaseUser)
@@ -258,7 +282,7 @@ class TestData(AsyncBotTestCase):
                 # read_id=285,
                 # recv_id=285,
                 # del_id=22,
-                public=to_json({"fn": "Test User"}),
+                public=_JSON_FN_TEST_USER,
                 # last_seen_time=1709705329000,
                 # last_seen_user_agent="Tindroid/0.22.12 (Android 11; zh_CN); tindroid/0.22.12"
             )
@@ -276,7 +300,7 @@ class TestData(AsyncBotTestCase):
             sub=[
                 pb.TopicSub(
                     updated_at=1708326544978,
-                    public=to_json({"fn": "Test User1"}),
+                    public=_JSON_FN_TEST_USER1,
                     topic="usr_test_2"
                 ),
                 # pb.TopicSub(
@@ -315,7 +339,7 @@ class TestData(AsyncBotTestCase):
                 read_id=121,
                 recv_id=121,
                 del_id=2,
-                public=to_json({"fn": "Test Group", "note": "Test Group Note"}),
+                public=_JSON_TEST_GROUP,
                 is_chan=True
             )
         )
@@ -10,6 +10,9 @@ from .utils import TEST_UID, AsyncBotTestCase, new_test_message, TEST_TIMEOUT, T
 
 
 class TestSession(AsyncBotTestCase):
+    # messages are frozen, so one parsed message can back every test session
+    message = new_test_message()
+
     async def test_init(self) -> None:
         async def session_task() -> BaseSession:
             async with BaseSession(self.bot, TEST_TOPIC) as ss:
@@ -26,7 +29,7 @@ class TestSession(AsyncBotTestCase):
                 pass
 
     async def test_send(self) -> None:
-        ss = MessageSession(self.bot, new_test_message())
+        ss = MessageSession(self.bot, self.message)
         self.assertEqual(ss.topic, TEST_TOPIC)
         self.assertEqual(ss.last_message.user_id, TEST_UID)
         self.assertEqual(ss.last_message.plain_text, "test")
@@ -50,7 +53,7 @@ class TestSession(AsyncBotTestCase):
         self.assertEqual(msg.content, b'{"txt": "test"}')
 
     async def test_form(self) -> None:
-        ss = MessageSession(self.bot, new_test_message())
+        ss = MessageSession(self.bot, self.message)
         form_task = asyncio.create_task(
             ss.send_form(
                 "title", "Yes", Button(text="No"), Button(text="Cancel", name="cancel")
@@ -68,7 +71,7 @@ class TestSession(AsyncBotTestCase):
         self.assertEqual(bid, 0)
 
     async def test_form1(self) -> None:
-        ss = MessageSession(self.bot, new_test_message())
+        ss = MessageSession(self.bot, self.message)
         form_task = asyncio.create_task(
             ss.send_form(
                 "title", "Yes", Button(text="No"), Button(text="Cancel", name="cancel")
@@ -84,7 +87,7 @@ class TestSession(AsyncBotTestCase):
         self.assertEqual(bid, 1)
 
     async def test_form2(self) -> None:
-        ss = MessageSession(self.bot, new_test_message())
+        ss = MessageSession(self.bot, self.message)
         form_task = asyncio.create_task(
             ss.send_form(
                 "title",
@@ -103,7 +106,7 @@ class TestSession(AsyncBotTestCase):
         self.assertEqual(bid, 2)
 
     async def test_file(self) -> None:
-        ss = MessageSession(self.bot, new_test_message())
+        ss = MessageSession(self.bot, self.message)
         file_task = asyncio.create_task(ss.send_file("karuha/version.py"))
         pubmsg = await self.get_bot_pub()
         df = Drafty.model_validate_json(pubmsg.content)
@@ -115,7 +118,7 @@ class TestSession(AsyncBotTestCase):
         await self.wait_for(file_task)
 
     async def test_image(self) -> None:
-        ss = MessageSession(self.bot, new_test_message())
+        ss = MessageSession(self.bot, self.message)
         image_task = asyncio.create_task(ss.send_image("docs/img/tw_icon-karuha2.png"))
         pubmsg = await self.get_bot_pub()
         df = Drafty.model_validate_json(pubmsg.content)
@@ -132,8 +135,7 @@ class TestSession(AsyncBotTestCase):
         # test get single data
         task = asyncio.create_task(ss.get_data(seq_id=114))
         await self.assert_bot_sub()
-        getmsg = await self.get_bot_sent()
-        self.assertTrue(getmsg.HasField("get"))
+        getmsg = await self.get_bot_sent_of("get")
         self.assertEqual(getmsg.get.query.data.since_id, 114)
         self.assertEqual(getmsg.get.query.data.before_id, 115)
         await self.put_bot_content(b"\"test\"", topic="test_get_data", seq_id=114)
@@ -146,17 +148,11 @@ class TestSession(AsyncBotTestCase):
 
         # test get data range
         task = asyncio.create_task(ss.get_data(low=113, hi=115))
-        getmsg = await self.get_bot_sent()
-        if getmsg.HasField("note"):
-            getmsg = await self.get_bot_sent()
-        self.assertTrue(getmsg.HasField("get"), getmsg)
+        getmsg = await self.get_bot_sent_of("get")
         self.assertEqual(getmsg.get.query.data.since_id, 113)
         self.assertEqual(getmsg.get.query.data.before_id, 114)
         await self.put_bot_content(b"\"113\"", topic="test_get_data", seq_id=113)
-        getmsg = await self.get_bot_sent()
-        if getmsg.HasField("note"):
-            getmsg = await self.get_bot_sent()
-        self.assertTrue(getmsg.HasField("get"), getmsg)
+        getmsg = await self.get_bot_sent_of("get")
         self.assertEqual(getmsg.get.query.data.since_id, 115)
         self.assertEqual(getmsg.get.query.data.before_id, 116)
         await self.put_bot_content(b"\"115\"", topic="test_get_data", seq_id=115)
@@ -32,6 +32,14 @@ class JsonFileSyncStore(JsonFileStore[DataPk1]):
     enable_async_backend = False
 
 
+class JsonFileCountingStore(JsonFileStore[DataPk1]):
+    writes = 0
+
+    def _write_file(self, data: bytes) -> None:
+        self.writes += 1
+        super()._write_file(data)
+
+
 class TestStore(IsolatedAsyncioTestCase):
     def test_data_model(self) -> None:
         self.assertTrue(is_pk_annotation(PrimaryKey))
@@ -178,6 +186,32 @@ class TestStore(IsolatedAsyncioTestCase):
         await asyncio.wait_for(store.wait_tasks(), timeout=TEST_TIMEOUT)
         self.assertFalse(store._should_wait())
     
+    async def test_json_store_coalesce(self) -> None:
+        await greenback.ensure_portal()
+        store = JsonFileCountingStore("test_coalesce")
+        await store.wait_tasks()
+        store.writes = 0
+
+        store.save_backend()
+        task = store._save_task
+        store.save_backend()
+        store.save_backend()
+        self.assertIs(store._save_task, task)
+        self.assertEqual(len(store._save_tasks), 1)
+        await asyncio.wait_for(store.wait_tasks(), timeout=TEST_TIMEOUT)
+        self.assertEqual(store.writes, 1)
+
+        # a task left pending on another loop must not swallow later saves
+        loop = asyncio.new_event_loop()
+        try:
+            store._save_task = loop.create_future()  # type: ignore
+            store.save_backend()
+            self.assertIs(store._save_task.get_loop(), asyncio.get_running_loop())
+            await asyncio.wait_for(store.wait_tasks(), timeout=TEST_TIMEOUT)
+            self.assertEqual(store.writes, 2)
+        finally:
+            loop.close()
+    
     def test_sync_json_store(self) -> None:
         store = JsonFileSyncStore.get_store(indent=4)
         self.assertIs(store.data_type, DataPk1)
@@ -193,3 +227,13 @@ class TestStore(IsolatedAsyncioTestCase):
         with open(store.path, "rb") as f:
             content = f.read()
         self.assertEqual(from_json(content), [data.model_dump()])
+
+        data1 = DataPk1(pk1="test1", content="test1")
+        with store.batch():
+            store.add(data1)
+            data1.content = "test1_new"
+            with open(store.path, "rb") as f:
+                self.assertEqual(from_json(f.read()), [data.model_dump()])
+        with open(store.path, "rb") as f:
+            content = f.read()
+        self.assertEqual(from_json(content), [data.model_dump(), data1.model_dump()])
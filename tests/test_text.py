@@ -169,6 +169,37 @@ class TestText(TestCase):
         df1 = "Hello" + Drafty.from_str(" world")
         self.assertEqual(df, df1)
 
+        a = Drafty.model_validate({
+            "txt": "Hello",
+            "fmt": [{"at": 0, "len": 5, "key": 0}],
+            "ent": [{"tp": "LN", "data": {"url": "https://example.com"}}],
+        })
+        b = Drafty.model_validate({
+            "txt": " world",
+            "fmt": [{"at": 1, "len": 5, "tp": "ST"}, {"at": 1, "len": 5, "key": 0}],
+            "ent": [{"tp": "MN", "data": {"val": "usr_test"}}],
+        })
+        a_fmt, a_ent = a.fmt.copy(), a.ent.copy()
+        b_fmt, b_ent = b.fmt.copy(), b.ent.copy()
+        df = a + b
+        self.assertEqual(str(df), "Hello world")
+        self.assertEqual(len(df.fmt), 3)
+        self.assertEqual(len(df.ent), 2)
+        self.assertEqual(a.fmt, a_fmt)
+        self.assertEqual(a.ent, a_ent)
+        self.assertEqual(b.fmt, b_fmt)
+        self.assertEqual(b.ent, b_ent)
+
+        df = a + "!"
+        df += b
+        self.assertEqual(a.fmt, a_fmt)
+        self.assertEqual(a.ent, a_ent)
+        df = "Hi " + a
+        self.assertEqual(str(df), "Hi Hello")
+        df += b
+        self.assertEqual(a.fmt, a_fmt)
+        self.assertEqual(a.ent, a_ent)
+
     def test_file(self) -> None:
         f = File(
             name="test.txt",
@@ -1,16 +1,14 @@
 import asyncio
-import json
 import os
 from io import IOBase
-import random
-import string
-from time import time
-from typing import (Any, Awaitable, BinaryIO, Callable, ClassVar, Dict,
-                    Optional, TypeVar, Union)
+import secrets
+import sys
+from typing import (Any, AsyncContextManager, Awaitable, BinaryIO, Callable,
+                    ClassVar, Dict, List, Optional, TypeVar, Union)
 from unittest import IsolatedAsyncioTestCase, SkipTest
 
 from tinode_grpc import pb
-from aiofiles import open as aio_open
+from pydantic_core import to_json
 
 from karuha import (Config, async_run, cancel_all_bots, get_bot, reset,
                     try_add_bot)
@@ -32,6 +30,56 @@ TEST_TOPIC = "grp_test"
 T = TypeVar("T")
 
 
+class _Timeout:
+    # minimal stand-in for asyncio.timeout on Python < 3.11
+    __slots__ = ["delay", "_handle", "_expired"]
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self._handle = None
+        self._expired = False
+
+    def _expire(self, task: "asyncio.Task[Any]") -> None:
+        self._expired = True
+        task.cancel()
+
+    async def __aenter__(self) -> "_Timeout":
+        task = asyncio.current_task()
+        assert task is not None
+        self._handle = asyncio.get_running_loop().call_later(self.delay, self._expire, task)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        if self._expired and exc_type is asyncio.CancelledError:
+            raise asyncio.TimeoutError from exc
+
+
+def timeout(delay: float = TEST_TIMEOUT) -> AsyncContextManager[Any]:
+    if sys.version_info >= (3, 11):
+        return asyncio.timeout(delay)
+    return _Timeout(delay)  # pragma: no cover
+
+
+async def _wait_for(aw: Awaitable[T], delay: Optional[float] = TEST_TIMEOUT) -> T:
+    # unlike asyncio.wait_for, this does not wrap coroutines in a new task
+    if delay is None:
+        return await aw
+    async with timeout(delay):
+        return await aw
+
+
+def _read_file(path: Union[str, os.PathLike]) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write_file(path: Union[str, os.PathLike], data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 class MockServer(BaseServer, type="mock"):
     __slots__ = ["send_queue", "recv_queue", "upload_data"]
 
@@ -43,15 +91,18 @@ class MockServer(BaseServer, type="mock"):
         self.upload_data = {}
         return await super().start()
     
-    async def put_received(self, message: pb.ServerMsg, /) -> None:
-        await self.recv_queue.put(message)
+    async def put_received(self, *messages: pb.ServerMsg) -> None:
+        # recv_queue is unbounded, so a batch can be pushed without yielding per message
+        for message in messages:
+            self.recv_queue.put_nowait(message)
     
     async def get_sent(self) -> pb.ClientMsg:
         return await self.send_queue.get()
     
     async def send(self, msg: pb.ClientMsg) -> None:
         self._ensure_running()
-        await self.send_queue.put(msg)
+        # send_queue is unbounded, so putting never has to wait
+        self.send_queue.put_nowait(msg)
     
     async def __anext__(self) -> pb.ServerMsg:
         self._ensure_running()
@@ -67,9 +118,9 @@ class MockServer(BaseServer, type="mock"):
             path.seek(0)
             data = path.read()
         else:
-            async with aio_open(path, "rb") as f:
-                data = await f.read()
-        uri = ''.join(random.choice(string.ascii_letters) for _ in range(32))
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, _read_file, path)
+        uri = secrets.token_hex(16)
         url = f"/v0/file/s/{uri}"
         self.upload_data[url] = data
         return {"url": url}
@@ -87,8 +138,8 @@ class MockServer(BaseServer, type="mock"):
             path.seek(0)
             path.write(data)
         else:
-            async with aio_open(path, "wb") as f:
-                await f.write(data)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _write_file, path, data)
         return len(data)
 
 
@@ -98,12 +149,40 @@ class BotMock(Bot):
     server_info = {}
     account_info = {"user": TEST_UID}
 
+    def __init__(self, *args: Any, **kwds: Any) -> None:
+        self._state_waiters: Dict[BotState, List[asyncio.Future]] = {}
+        super().__init__(*args, **kwds)
+
+    # Bot keeps ``state`` in a slot. This property wraps that slot descriptor so
+    # every state assignment made by Bot also wakes the matching wait_state callers.
+    @property
+    def state(self) -> BotState:
+        return Bot.state.__get__(self, Bot)  # type: ignore
+    
+    @state.setter
+    def state(self, state: BotState) -> None:
+        Bot.state.__set__(self, state)  # type: ignore
+        for waiter in self._state_waiters.pop(state, ()):
+            if not waiter.done():
+                waiter.set_result(None)
+
     async def wait_state(self, state: BotState, /, timeout: float = TEST_TIMEOUT) -> None:
-        start = time()
-        while self.state != state:
-            await asyncio.sleep(0)
-            if time() - start > timeout:
-                raise TimeoutError(f"bot state has not changed to {state}")
+        """wait until the bot enters the state, woken by the state setter above"""
+        if self.state == state:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        waiters = self._state_waiters.setdefault(state, [])
+        waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"bot state has not changed to {state}") from None
+        finally:
+            # the setter pops the list when it fires, so only timed out waiters are left here
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters and self._state_waiters.get(state) is waiters:
+                del self._state_waiters[state]
 
     async def wait_init(self) -> None:
         with EventCatcher(BotReadyEvent) as catcher:
@@ -114,6 +193,9 @@ class BotMock(Bot):
         self.account_info = {"user": TEST_UID}
     
 
+_OK_CTRL = pb.ServerCtrl(topic="test", code=200, text="OK")
+_DEFAULT_HEAD = {"auto": b"true"}
+
 bot_mock_server = ServerConfig(connect_mode="mock")
 bot_mock = BotMock("test", "basic", "123456", log_level="DEBUG")
 
@@ -148,36 +230,56 @@ class AsyncBotTestCase(IsolatedAsyncioTestCase):
     async def asyncTearDown(self) -> None:
         self.assertEqual(self.bot.state, BotState.running)
         cancel_all_bots()
-        try:
-            await self.wait_for(self._main_task)
-        except asyncio.CancelledError:
-            pass
+        done, _ = await asyncio.wait({self._main_task}, timeout=TEST_TIMEOUT)
+        self.assertTrue(done, "bot runner did not stop in time")
+        if not self._main_task.cancelled():
+            self._main_task.result()
     
     catchEvent = EventCatcher
 
     async def get_bot_sent(self) -> pb.ClientMsg:
-        return await self.wait_for(self.bot.server.get_sent())
+        try:
+            # messages are usually queued already, so skip the wait_for task
+            return self.bot.server.send_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        # a timeout scope avoids the extra task wait_for wraps around the coroutine
+        async with self.timeout():
+            return await self.bot.server.get_sent()
+    
+    async def get_bot_sent_of(self, kind: str) -> pb.ClientMsg:
+        while True:
+            msg = await self.get_bot_sent()
+            found = msg.WhichOneof("Message")
+            if found == kind:
+                return msg
+            # note frames come from the DataEvent handler and may interleave
+            self.assertEqual(found, "note", f"{msg} is not {kind}")
     
-    async def put_bot_received(self, message: pb.ServerMsg, /) -> None:
-        await self.bot.server.put_received(message)
+    async def put_bot_received(self, *messages: pb.ServerMsg) -> None:
+        await self.bot.server.put_received(*messages)
     
     def get_latest_tid(self) -> str:
         assert len(self.bot._wait_list) == 1
-        return tuple(self.bot._wait_list.keys())[0]
+        return next(iter(self.bot._wait_list))
     
     def confirm_message(self, tid: Optional[str] = None, code: int = 200, **params: Any) -> str:
         if tid is None:
             tid = self.get_latest_tid()
-        text = "test error" if code < 200 or code >= 400 else "OK"
-        self.bot._wait_list[tid].set_result(
-            pb.ServerCtrl(
+        if code == 200 and not params:
+            ctrl = pb.ServerCtrl()
+            ctrl.CopyFrom(_OK_CTRL)
+            ctrl.id = tid
+        else:
+            text = "test error" if code < 200 or code >= 400 else "OK"
+            ctrl = pb.ServerCtrl(
                 id=tid,
                 topic="test",
                 code=code,
                 text=text,
-                params={k: json.dumps(v).encode() for k, v in params.items()}
+                params={k: to_json(v) for k, v in params.items()}
             )
-        )
+        self.bot._wait_list[tid].set_result(ctrl)
         return tid
     
     async def assert_bot_message(self, message: pb.ClientMsg, /) -> None:
@@ -185,15 +287,18 @@ class AsyncBotTestCase(IsolatedAsyncioTestCase):
         self.assertEqual(sent, message)
     
     async def get_bot_pub(self, seq: int = 0) -> pb.ClientPub:
-        msg = await self.get_bot_sent()
-        if msg.HasField("note"):
-            # from DataEvent handler
+        while True:
             msg = await self.get_bot_sent()
-        if msg.HasField("sub"):
-            # from session.send
-            self.confirm_message(msg.sub.id)
-            msg = await self.get_bot_sent()
-        self.assertTrue(msg.HasField("pub"), f"{msg} is not pub")
+            kind = msg.WhichOneof("Message")
+            if kind == "note":
+                # from DataEvent handler
+                continue
+            elif kind == "sub":
+                # from session.send
+                self.confirm_message(msg.sub.id)
+                continue
+            break
+        self.assertEqual(kind, "pub", f"{msg} is not pub")
         self.confirm_message(msg.pub.id, seq=seq)
         return msg.pub
     
@@ -204,7 +309,7 @@ class AsyncBotTestCase(IsolatedAsyncioTestCase):
             topic: str = TEST_TOPIC,
             from_user_id: str = TEST_UID,
             seq_id: int = 0,
-            head: Dict[str, bytes] = {"auto": b"true"}
+            head: Optional[Dict[str, bytes]] = None
     ) -> None:
         await self.put_bot_received(
             pb.ServerMsg(
@@ -212,7 +317,8 @@ class AsyncBotTestCase(IsolatedAsyncioTestCase):
                     topic=topic,
                     from_user_id=from_user_id,
                     seq_id=seq_id,
-                    head=head.copy(),
+                    # the map field copies its items, so the shared default needs no copy
+                    head=_DEFAULT_HEAD if head is None else head,
                     content=content,
                 )
             )
@@ -234,11 +340,15 @@ class AsyncBotTestCase(IsolatedAsyncioTestCase):
     
     async def assert_note_read(self, topic: str, seq_id: int, /) -> None:
         assert await self.get_bot_sent() == pb.ClientMsg(
-            note_read=pb.ClientNote(topic=topic, seq_id=seq_id, what=pb.READ)
+            note=pb.ClientNote(topic=topic, seq_id=seq_id, what=pb.READ)
         )
     
     async def wait_for(self, future: Awaitable[T], /, timeout: Optional[float] = TEST_TIMEOUT) -> T:
-        return await asyncio.wait_for(future, timeout)
+        return await _wait_for(future, timeout)
+
+    def timeout(self, delay: float = TEST_TIMEOUT) -> AsyncContextManager[Any]:
+        # a single timer scope, without the extra task that wait_for creates
+        return timeout(delay)
 
 
 class AsyncBotOnlineTestCase(IsolatedAsyncioTestCase):
@@ -271,15 +381,15 @@ class AsyncBotOnlineTestCase(IsolatedAsyncioTestCase):
     async def asyncTearDown(self) -> None:
         self.assertEqual(self.bot.state, BotState.running)
         cancel_all_bots()
-        try:
-            await self.wait_for(self._main_task)
-        except asyncio.CancelledError:
-            pass
+        done, _ = await asyncio.wait({self._main_task}, timeout=TEST_TIMEOUT)
+        self.assertTrue(done, "bot runner did not stop in time")
+        if not self._main_task.cancelled():
+            self._main_task.result()
     
     catchEvent = EventCatcher
 
     async def wait_for(self, future: Awaitable[T], /, timeout: Optional[float] = TEST_TIMEOUT) -> T:
-        return await asyncio.wait_for(future, timeout)
+        return await _wait_for(future, timeout)
     
 
 def new_test_message(content: bytes = b"\"test\"", *, topic: str = TEST_TOPIC, user_id: str = TEST_UID) -> Message:
@@ -288,11 +398,15 @@ def new_test_message(content: bytes = b"\"test\"", *, topic: str = TEST_TOPIC, u
     )
 
 
+_test_command = FunctionCommand("test", lambda: None)
+_test_collection = new_collection()
+
+
 def new_test_command_message(content: bytes = b"\"test\"") -> CommandMessage:
     return CommandMessage.from_message(
         new_test_message(content),
-        FunctionCommand("test", lambda: None),
-        new_collection(),
+        _test_command,
+        _test_collection,
         "test",
         []
     )